@@ -7,12 +7,45 @@ bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
 backlog = 2048
 
 # Worker processes
-workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
-worker_class = "sync"
-worker_connections = 1000
+# gevent workers serve many requests concurrently and yield while waiting on the
+# database; load the app through wsgi.py so the stdlib is patched.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+# One gevent worker per core is enough; 2 * cores + 1 only suits sync workers
+default_workers = multiprocessing.cpu_count()
+if worker_class == "sync":
+    default_workers = default_workers * 2 + 1
+workers = int(os.getenv("GUNICORN_WORKERS", default_workers))
+# Connections the app may open in total; Postgres defaults to max_connections=100
+db_max_connections = int(os.getenv("DB_MAX_CONNECTIONS", "100"))
 timeout = 30
 keepalive = 2
 
+# Import the app once in the master so startup work (init_db) is not repeated per worker
+preload_app = True
+
+
+def on_starting(server):
+    # Each worker holds its own DB pool, so warn when they can outgrow the server
+    from app import DB_MAX_OVERFLOW, DB_POOL_SIZE
+
+    total = (DB_POOL_SIZE + DB_MAX_OVERFLOW) * workers
+    if total > db_max_connections:
+        server.log.warning(
+            "(DB_POOL_SIZE + DB_MAX_OVERFLOW) * workers = %d exceeds DB_MAX_CONNECTIONS = %d; "
+            "lower the pool size or GUNICORN_WORKERS",
+            total,
+            db_max_connections,
+        )
+
+
+def post_fork(server, worker):
+    # Drop pooled connections inherited from the master; each worker opens its own
+    from app import engine
+
+    engine.dispose(close=False)
+
+
 # Logging
 accesslog = "-"  # Log to stdout
 errorlog = "-"   # Log to stderr
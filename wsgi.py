@@ -0,0 +1,9 @@
+"""WSGI entrypoint for running the app under Gunicorn gevent workers."""
+# Patch the stdlib before anything else imports sockets, threads or ssl. psycopg 3
+# waits on its sockets through the patched select machinery, so database calls
+# yield to other greenlets without any driver-specific patch.
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import app  # noqa: E402,F401